@@ -15,48 +15,87 @@ State machine:
 """
 
 import asyncio
+import functools
+import re
 import time
 import logging
+from datetime import timedelta
+from collections.abc import Awaitable, Callable
 from enum import Enum
 
 import signal
+import socket
+import struct
 import atexit
+import aiohttp
 import discord
 from discord.ext import tasks
 import paramiko
 from dotenv import load_dotenv
 import os
-from mcrcon import MCRcon
-
-# ─── Intents ─────────────────────────────────────────────────────────────
-
-intents = discord.Intents.default()
-intents.message_content = True  # For reading message content
-intents.members = True  # If needed for member tracking
-client = discord.Client(intents=intents)  # Or Bot() if using commands
 
 # ─── Configuration ────────────────────────────────────────────────────────────
 
 load_dotenv()
 
-SFTP_HOST = os.environ.get("SFTP_HOST")
-SFTP_PORT = os.environ.get("SFTP_PORT")
-if SFTP_PORT:
-    SFTP_PORT = int(SFTP_PORT)
-SFTP_USER = os.environ.get("SFTP_USER")
-SFTP_PASSWORD = os.environ.get("SFTP_PASSWORD")
-SFTP_KEY_PATH = os.environ.get("SFTP_KEY_PATH")
-DEBUG_LOG_PATH = os.environ.get("DEBUG_LOG_PATH")
+REQUIRED_ENV = (
+    "SFTP_HOST",
+    "SFTP_PORT",
+    "SFTP_USER",
+    "DEBUG_LOG_PATH",
+    "RCON_HOST",
+    "RCON_PORT",
+    "RCON_PASSWORD",
+    "DISCORD_TOKEN",
+    "DISCORD_CHANNEL_ID",
+)
+_missing = [name for name in REQUIRED_ENV if not os.environ.get(name)]
+if not (os.environ.get("SFTP_PASSWORD") or os.environ.get("SFTP_KEY_PATH")):
+    _missing.append("SFTP_PASSWORD or SFTP_KEY_PATH")
+if _missing:
+    raise SystemExit(f"Missing required environment variables: {', '.join(_missing)}")
 
-RCON_HOST = os.environ.get("RCON_HOST")
-RCON_PORT = os.environ.get("RCON_PORT")
-RCON_PASSWORD = os.environ.get("RCON_PASSWORD")
 
-DISCORD_TOKEN = os.environ.get("DISCORD_TOKEN")
-DISCORD_CHANNEL_ID = os.environ.get("DISCORD_CHANNEL_ID")
+def _env_int(name: str) -> int:
+    value = os.environ[name]
+    try:
+        return int(value)
+    except ValueError:
+        raise SystemExit(f"{name} must be an integer, got {value!r}") from None
 
-POLL_INTERVAL = 5  # seconds between each SFTP stat check
+
+SFTP_HOST = os.environ["SFTP_HOST"]
+SFTP_PORT = _env_int("SFTP_PORT")
+SFTP_USER = os.environ["SFTP_USER"]
+SFTP_PASSWORD = os.environ.get("SFTP_PASSWORD")
+SFTP_KEY_PATH = os.environ.get("SFTP_KEY_PATH")
+DEBUG_LOG_PATH = os.environ["DEBUG_LOG_PATH"]
+
+RCON_HOST = os.environ["RCON_HOST"]
+RCON_PORT = _env_int("RCON_PORT")
+RCON_PASSWORD = os.environ["RCON_PASSWORD"]
+
+DISCORD_TOKEN = os.environ["DISCORD_TOKEN"]
+DISCORD_CHANNEL_ID = _env_int("DISCORD_CHANNEL_ID")
+
+POLL_INTERVAL = 5  # seconds between each SFTP stat check while things change
+POLL_INTERVAL_MAX = 30  # backoff cap when nothing changed for a while
+POLL_INTERVAL_STARTING = 2  # fast polling to catch STARTING → ONLINE quickly
+SFTP_CALL_TIMEOUT = POLL_INTERVAL - 1  # wait on the SFTP thread before skipping a poll
+SOCKET_BUFFER_SIZE = 32 << 20  # SFTP socket send/receive buffers
+SSH_WINDOW_SIZE = 2**27  # SSH channel window, paramiko's 2MB default throttles slow links
+SSH_KEEPALIVE_SECONDS = 30  # transport-level keepalive on the persistent session
+SFTP_IDLE_PING_SECONDS = 60  # verify the session before use after this long idle
+LOG_TAIL_BYTES = 4096  # 4KB — more than enough to catch "Stopping server"
 LOG_STALE_SECONDS = 40  # seconds of no log update before declaring OFFLINE
+CLEANUP_CONCURRENCY = 5  # parallel deletes when clearing old status messages
+# Once the status message is found, stop scanning for older duplicates after this
+# many messages from other users, or at the first one older than CLEANUP_MAX_AGE
+CLEANUP_MAX_NON_MATCHES = 10
+CLEANUP_MAX_AGE = timedelta(days=1)
+DISCORD_QUEUE_SIZE = 100  # pending Discord calls kept during an outage, extras dropped
+RCON_TIMEOUT = 5  # seconds for an RCON connect/auth or command round trip
+RCON_RECHECK_SECONDS = 30  # max seconds between RCON checks while the log is quiet
 
 # ─── Logging ──────────────────────────────────────────────────────────────────
 
@@ -79,6 +118,7 @@ STATUS_EMOJI = {
     Status.STARTING: "🟡",
     Status.ONLINE: "🟢",
 }
+_STATUS_PREFIXES = tuple(STATUS_EMOJI.values())
 
 # ─── SFTP ─────────────────────────────────────────────────────────────────────
 
@@ -87,8 +127,13 @@ class SFTPMonitor:
     def __init__(self):
         self._client = None
         self._sftp = None
+        self._log_file = None  # log handle kept open across polls
         self._last_connect_attempt = 0
         self._reconnect_delay = 15  # seconds to wait between reconnect attempts
+        self._last_ok = 0.0  # time of the last successful stat
+        self._last_size = 0  # log size at the previous successful read
+        self._last_mtime_seen: float | None = None
+        self._tail = b""  # rolling window of the last LOG_TAIL_BYTES of the log
 
     def _connect(self):
         now = time.time()
@@ -100,6 +145,10 @@ class SFTPMonitor:
             return False
         self._last_connect_attempt = now
         self._close()
+        sock = socket.create_connection((SFTP_HOST, SFTP_PORT), timeout=10)
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, SOCKET_BUFFER_SIZE)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, SOCKET_BUFFER_SIZE)
         client = paramiko.SSHClient()
         client.set_missing_host_key_policy(paramiko.AutoAddPolicy())
         kwargs = dict(
@@ -109,18 +158,56 @@ class SFTPMonitor:
             timeout=10,
             look_for_keys=False,
             allow_agent=False,
+            compress=True,
+            sock=sock,
         )
         if SFTP_KEY_PATH:
             kwargs["key_filename"] = SFTP_KEY_PATH
         else:
             kwargs["password"] = SFTP_PASSWORD
-        client.connect(**kwargs)
+        try:
+            client.connect(**kwargs)
+        except Exception:
+            sock.close()
+            raise
+        transport = client.get_transport()
+        transport.set_keepalive(SSH_KEEPALIVE_SECONDS)
         self._client = client
-        self._sftp = client.open_sftp()
+        self._sftp = paramiko.SFTPClient.from_transport(
+            transport, window_size=SSH_WINDOW_SIZE
+        )
         self._last_connect_attempt = 0  # reset on success
+        self._last_ok = time.time()
         log.info("SFTP connected.")
 
+    def _close_log_file(self):
+        if self._log_file is None:
+            return
+        try:
+            self._log_file.close()
+        except Exception:
+            pass
+        self._log_file = None
+
+    def _reset_tail(self):
+        """Forget the previous log file: new handle, tail re-read from scratch."""
+        self._close_log_file()
+        self._tail = b""
+        self._last_size = 0
+
+    def _read_log(self, offset: int, length: int) -> bytes:
+        """Reads via the held log handle; comes back short if its file ends early."""
+        if self._log_file is None:
+            self._log_file = self._sftp.open(DEBUG_LOG_PATH, "r")
+        try:
+            # At most LOG_TAIL_BYTES: a single SFTP READ, nothing to pipeline
+            self._log_file.seek(offset)
+            return self._log_file.read(length)
+        except EOFError:
+            return b""
+
     def _close(self):
+        self._reset_tail()  # the log may have rotated while we were disconnected
         try:
             if self._sftp:
                 self._sftp.close()
@@ -131,12 +218,34 @@ class SFTPMonitor:
         self._sftp = None
         self._client = None
 
-    def get_log_info(self) -> tuple[float, str] | None:
+    def _ensure_alive(self):
+        """Drop the session if its transport died or it stopped answering while idle."""
+        transport = self._client.get_transport() if self._client else None
+        if transport is None or not transport.is_active():
+            log.info("SFTP transport is gone — reconnecting")
+            self._close()
+            return
+        if time.time() - self._last_ok > SFTP_IDLE_PING_SECONDS:
+            try:
+                self._sftp.normalize(".")
+            except (paramiko.SSHException, OSError, EOFError) as e:
+                log.info(f"Idle SFTP session is dead ({e}) — reconnecting")
+                self._close()
+
+    def get_log_info(self) -> tuple[float, bytes] | None:
         """
-        Returns (mtime, tail_text) by reading only the last 8KB of the log.
-        Returns None on connection failure.
+        Returns (mtime, tail_bytes) where tail_bytes covers the last 4KB of the log.
+        Only bytes appended since the previous poll are downloaded, through a
+        file handle that stays open between polls. A shrinking file, or a held
+        handle that hits EOF before the stat'ed size (the path now points at a
+        new file), is treated as a rotation: the handle is reopened and the
+        tail re-read.
+        Returns None on connection failure. The session is only torn down on
+        transport-level errors; a missing or unreadable log keeps it open.
         """
         try:
+            if self._sftp is not None:
+                self._ensure_alive()
             if self._sftp is None:
                 connected = self._connect()
                 if connected is False:
@@ -144,12 +253,28 @@ class SFTPMonitor:
             attrs = self._sftp.stat(DEBUG_LOG_PATH)
             mtime = float(attrs.st_mtime)
             size = attrs.st_size
-            tail_size = 4096  # 4KB — more than enough to catch "Stopping server"
-            offset = max(0, size - tail_size)
-            with self._sftp.open(DEBUG_LOG_PATH, "r") as f:
-                f.seek(offset)
-                tail = f.read().decode("utf-8", errors="replace")
-            return mtime, tail
+            self._last_ok = time.time()
+            if mtime == self._last_mtime_seen and size == self._last_size:
+                return mtime, self._tail  # nothing written since last poll
+            if size < self._last_size:
+                log.info("Log shrank — assuming rotation, re-reading tail")
+                self._reset_tail()
+            offset = max(self._last_size, size - LOG_TAIL_BYTES)
+            if offset < size:
+                reused_handle = self._log_file is not None
+                new_bytes = self._read_log(offset, size - offset)
+                if reused_handle and len(new_bytes) < size - offset:
+                    log.info("Log handle ended early — assuming rotation, re-reading")
+                    self._reset_tail()
+                    offset = max(0, size - LOG_TAIL_BYTES)
+                    new_bytes = self._read_log(offset, size - offset)
+                self._tail = (self._tail + new_bytes)[-LOG_TAIL_BYTES:]
+            self._last_size = size
+            self._last_mtime_seen = mtime
+            return mtime, self._tail
+        except (FileNotFoundError, PermissionError) as e:
+            log.warning(f"Cannot read {DEBUG_LOG_PATH}: {e}")
+            self._reset_tail()
         except (paramiko.SSHException, OSError, EOFError) as e:
             log.warning(f"SFTP error: {e}")
             self._close()
@@ -159,26 +284,78 @@ class SFTPMonitor:
 # ─── RCON ─────────────────────────────────────────────────────────────────────
 
 
-def try_rcon_get_players() -> tuple[bool, int, list[str]]:
+# "There are 2 of a max of 20 players online: A, B" (current) or "There are 2/20 …" (older)
+_LIST_RE = re.compile(r"(\d+)\D+\d+ players online:(.*)", re.DOTALL)
+
+
+class RconClient:
+    """
+    Minimal async Minecraft RCON client that keeps one authenticated
+    connection open across polls. Any error closes it; the next command
+    reconnects.
+    """
+
+    _TYPE_COMMAND = 2
+    _TYPE_AUTH = 3
+
+    def __init__(self):
+        self._reader: asyncio.StreamReader | None = None
+        self._writer: asyncio.StreamWriter | None = None
+        self._request_id = 0
+
+    async def _connect(self):
+        log.info(f"Attempting RCON connection to {RCON_HOST}:{RCON_PORT}...")
+        self._reader, self._writer = await asyncio.open_connection(RCON_HOST, RCON_PORT)
+        response_id, _ = await self._request(self._TYPE_AUTH, RCON_PASSWORD)
+        if response_id == -1:
+            raise ConnectionError("RCON authentication failed")
+        log.info("RCON connected.")
+
+    async def _request(self, packet_type: int, body: str) -> tuple[int, str]:
+        self._request_id += 1
+        packet = struct.pack("<ii", self._request_id, packet_type)
+        packet += body.encode("utf-8") + b"\x00\x00"
+        self._writer.write(struct.pack("<i", len(packet)) + packet)
+        await self._writer.drain()
+        while True:
+            (length,) = struct.unpack("<i", await self._reader.readexactly(4))
+            response = await self._reader.readexactly(length)
+            response_id, _ = struct.unpack("<ii", response[:8])
+            if response_id in (self._request_id, -1):
+                return response_id, response[8:-2].decode("utf-8", errors="replace")
+
+    async def command(self, command: str) -> str:
+        try:
+            if self._writer is None:
+                await asyncio.wait_for(self._connect(), RCON_TIMEOUT)
+            _, body = await asyncio.wait_for(
+                self._request(self._TYPE_COMMAND, command), RCON_TIMEOUT
+            )
+            return body
+        except BaseException:
+            self.close()  # a half-finished exchange leaves the stream unusable
+            raise
+
+    def close(self):
+        if self._writer is not None:
+            self._writer.close()
+        self._reader = None
+        self._writer = None
+
+
+async def rcon_get_players() -> tuple[bool, int, list[str]]:
     """
-    Synchronous — always call via asyncio.to_thread() to avoid blocking the event loop.
     Returns (success, player_count, player_names).
     """
-    log.info(f"Attempting RCON connection to {RCON_HOST}:{RCON_PORT}...")
     try:
-        with MCRcon(RCON_HOST, RCON_PASSWORD, port=RCON_PORT, timeout=5) as rcon:
-            response = rcon.command("list")
-            log.info(f"RCON response: {response!r}")
-            count, names = 0, []
-            if "players online:" in response:
-                parts = response.split("players online:")
-                for word in parts[0].split():
-                    if word.isdigit():
-                        count = int(word)
-                        break
-                if len(parts) > 1 and parts[1].strip():
-                    names = [n.strip() for n in parts[1].split(",") if n.strip()]
-            return True, count, names
+        response = await rcon_client.command("list")
+        log.info(f"RCON response: {response!r}")
+        count, names = 0, []
+        m = _LIST_RE.search(response)
+        if m:
+            count = int(m.group(1))
+            names = [n.strip() for n in m.group(2).split(",") if n.strip()]
+        return True, count, names
     except Exception as e:
         log.warning(f"RCON failed: {e}")
         return False, 0, []
@@ -194,6 +371,12 @@ STATUS_COLOR = {
 
 
 def build_status_embed(status: Status, players: list[str]) -> discord.Embed:
+    """Returns a fresh copy of the (cached) status embed for this status/player list."""
+    return _cached_status_embed(status, tuple(players)).copy()
+
+
+@functools.lru_cache(maxsize=32)
+def _cached_status_embed(status: Status, players: tuple[str, ...]) -> discord.Embed:
     emoji = STATUS_EMOJI[status]
 
     if status == Status.ONLINE:
@@ -219,7 +402,29 @@ def build_status_embed(status: Status, players: list[str]) -> discord.Embed:
     else:
         embed.add_field(name="👥 Players online (0)", value="-", inline=False)
 
-    embed.set_footer(text=f"🕐 Status updates every {POLL_INTERVAL} seconds")
+    embed.set_footer(
+        text=f"🕐 Status updates every {POLL_INTERVAL}–{POLL_INTERVAL_MAX} seconds"
+    )
+    return embed
+
+
+def build_player_change_embed(joined: list[str], left: list[str]) -> discord.Embed:
+    """One embed summarising every join/leave seen in a single poll."""
+    embed = discord.Embed(
+        color=STATUS_COLOR[Status.ONLINE] if joined else STATUS_COLOR[Status.OFFLINE]
+    )
+    if joined:
+        embed.add_field(
+            name="🟢  Joined",
+            value="\n".join(f"• **{p}**" for p in joined),
+            inline=False,
+        )
+    if left:
+        embed.add_field(
+            name="🔴  Left",
+            value="\n".join(f"• **{p}**" for p in left),
+            inline=False,
+        )
     return embed
 
 
@@ -234,50 +439,166 @@ def cleanup():
 
 # ─── Discord Bot ──────────────────────────────────────────────────────────────
 
+
+class StatusBot(discord.Client):
+    async def setup_hook(self):
+        # Runs once per process, unlike on_ready which fires again on every
+        # reconnect — so there is only ever one monitor loop polling SFTP/RCON
+        if not discord_worker.is_running():
+            discord_worker.start()
+        if not monitor_loop.is_running():
+            log.info("Starting monitor loop.")
+            monitor_loop.start()
+
+
 intents = discord.Intents.default()
-bot = discord.Client(intents=intents)
+bot = StatusBot(intents=intents)
 
 sftp_monitor = SFTPMonitor()
+rcon_client = RconClient()
 atexit.register(cleanup)
 signal.signal(signal.SIGTERM, lambda *_: cleanup())
 current_status = Status.OFFLINE
 last_mtime: float | None = None
 current_players: list[str] = []
 status_message: discord.Message | None = None
+last_rcon_check = 0.0
+last_mtime_for_rcon: float | None = None
+poll_interval: float = POLL_INTERVAL
+sftp_inflight: asyncio.Task | None = None
+# Outgoing Discord calls, sent in order by discord_worker so polling never waits on them
+discord_queue: asyncio.Queue[Callable[[], Awaitable[object]]] = asyncio.Queue(
+    maxsize=DISCORD_QUEUE_SIZE
+)
+# Latest status waiting to be posted; older ones are superseded, not replayed
+pending_status: tuple[discord.TextChannel, Status, list[str]] | None = None
 
 
 async def post_status(channel: discord.TextChannel, status: Status, players: list[str]):
-    """Delete old status message and repost it so it always sits at the bottom."""
+    """Edit the status message in place, or send a new one if there is none yet."""
     global status_message
-    if status_message:
+    embed = build_status_embed(status, players)
+    if status_message and status_message.channel.id == channel.id:
         try:
-            await status_message.delete()
+            status_message = await status_message.edit(embed=embed)
+            return
         except discord.NotFound:
             pass
-    status_message = await channel.send(embed=build_status_embed(status, players))
+    status_message = await channel.send(embed=embed)
+
+
+def enqueue(send: Callable[[], Awaitable[object]]) -> bool:
+    try:
+        discord_queue.put_nowait(send)
+        return True
+    except asyncio.QueueFull:
+        log.warning("Discord queue full — dropping update.")
+        return False
+
+
+def queue_status(channel: discord.TextChannel, status: Status, players: list[str]):
+    """Queue a status post, replacing any status that is still waiting to be sent."""
+    global pending_status
+    already_queued = pending_status is not None
+    pending_status = (channel, status, players)
+    if not already_queued and not enqueue(post_pending_status):
+        pending_status = None
+
+
+async def post_pending_status():
+    global pending_status
+    sent = pending_status
+    if sent is None:
+        return
+    try:
+        await post_status(*sent)
+    finally:
+        if pending_status is sent:
+            pending_status = None
+        elif not enqueue(post_pending_status):  # a newer status arrived meanwhile
+            pending_status = None
+
+
+def queue_player_changes(
+    channel: discord.TextChannel, joined: list[str], left: list[str]
+):
+    embed = build_player_change_embed(joined, left)
+    enqueue(functools.partial(channel.send, embed=embed))
+
+
+@tasks.loop()
+async def discord_worker():
+    send = await discord_queue.get()
+    try:
+        await send()
+    except Exception:
+        # Never let one failed call stop the worker and leave the queue to grow
+        log.exception("Discord update failed")
 
 
 @tasks.loop(seconds=POLL_INTERVAL)
 async def monitor_loop():
+    """Poll once, then back off while nothing changes and speed up when it does."""
+    global poll_interval
+
+    previous_status, previous_mtime = current_status, last_mtime
+    evaluated = await poll_server()
+
+    if current_status == Status.STARTING:
+        poll_interval = POLL_INTERVAL_STARTING
+    elif not evaluated:
+        # Nothing was learned (SFTP busy/unreachable): retry soon, don't back off
+        poll_interval = POLL_INTERVAL
+    elif current_status != previous_status or last_mtime != previous_mtime:
+        poll_interval = POLL_INTERVAL
+    else:
+        poll_interval = min(poll_interval * 2, POLL_INTERVAL_MAX)
+    monitor_loop.change_interval(seconds=poll_interval)
+
+
+def checked_log_info() -> tuple[tuple[float, bytes] | None, float]:
+    """get_log_info() plus the time it finished, for aging a result picked up late."""
+    result = sftp_monitor.get_log_info()
+    return result, time.time()
+
+
+async def poll_server() -> bool:
+    """Runs one poll; returns False if no fresh log info could be evaluated."""
     global current_status, last_mtime, current_players
+    global last_rcon_check, last_mtime_for_rcon, sftp_inflight
 
-    channel = bot.get_channel(int(DISCORD_CHANNEL_ID))
+    channel = bot.get_channel(DISCORD_CHANNEL_ID)
     if channel is None:
         log.error(f"Could not find Discord channel {DISCORD_CHANNEL_ID}")
-        return
+        return False
+
+    # Run blocking SFTP call in a thread so it never freezes the event loop. A call
+    # that outlives SFTP_CALL_TIMEOUT keeps running and is picked up by a later
+    # poll, instead of stacking another thread behind it.
+    if sftp_inflight is None:
+        sftp_inflight = asyncio.create_task(
+            asyncio.to_thread(checked_log_info)
+        )
+    try:
+        result, checked_at = await asyncio.wait_for(
+            asyncio.shield(sftp_inflight), SFTP_CALL_TIMEOUT
+        )
+    except asyncio.TimeoutError:
+        log.warning("SFTP call still in flight — skipping this poll.")
+        return False
+    finally:
+        if sftp_inflight.done():
+            sftp_inflight = None
 
     now = time.time()
 
-    # Run blocking SFTP call in a thread so it never freezes the event loop
-    result = await asyncio.to_thread(sftp_monitor.get_log_info)
-
     if result is None:
         log.warning("SFTP unreachable — keeping current state.")
-        return
+        return False
 
     mtime, log_tail = result
-    log_age = now - mtime
-    server_stopping = "Stopping server" in log_tail
+    log_age = checked_at - mtime  # as of the stat, even if collected polls later
+    server_stopping = b"Stopping server" in log_tail
     log.info(
         f"Log age: {log_age:.1f}s | Stopping: {server_stopping} | State: {current_status.value}"
     )
@@ -293,7 +614,7 @@ async def monitor_loop():
             current_status = Status.STARTING
             current_players = []
             last_mtime = mtime
-            await post_status(channel, Status.STARTING, [])
+            queue_status(channel, Status.STARTING, [])
 
     # ── STARTING ───────────────────────────────────────────────────────
     elif current_status == Status.STARTING:
@@ -302,49 +623,53 @@ async def monitor_loop():
             current_status = Status.OFFLINE
             current_players = []
             last_mtime = mtime
-            await post_status(channel, Status.OFFLINE, [])
+            queue_status(channel, Status.OFFLINE, [])
         elif log_age > LOG_STALE_SECONDS:
             log.info("Log went stale during STARTING → OFFLINE")
             current_status = Status.OFFLINE
             current_players = []
             last_mtime = mtime
-            await post_status(channel, Status.OFFLINE, [])
+            queue_status(channel, Status.OFFLINE, [])
         else:
-            # Run blocking RCON call in a thread
-            success, count, names = await asyncio.to_thread(try_rcon_get_players)
+            success, count, names = await rcon_get_players()
             if success:
                 log.info(f"RCON up — {count} player(s) → ONLINE")
+                last_rcon_check = now
+                last_mtime_for_rcon = mtime
                 current_status = Status.ONLINE
                 current_players = names
                 last_mtime = mtime
-                await post_status(channel, Status.ONLINE, names)
+                queue_status(channel, Status.ONLINE, names)
 
     # ── ONLINE ─────────────────────────────────────────────────────────
     elif current_status == Status.ONLINE:
-        success, count, names = await asyncio.to_thread(try_rcon_get_players)
+        # Joins/leaves are logged, so only ask RCON when the log moved
+        # (or periodically, as a safety net)
+        if (
+            mtime == last_mtime_for_rcon
+            and now - last_rcon_check < RCON_RECHECK_SECONDS
+        ):
+            last_mtime = mtime
+            return True
+
+        success, count, names = await rcon_get_players()
 
         if success:
-            joined = [p for p in names if p not in current_players]
-            left = [p for p in current_players if p not in names]
+            last_rcon_check = now
+            last_mtime_for_rcon = mtime
+            new, old = set(names), set(current_players)
+            joined = [p for p in names if p not in old]
+            left = [p for p in current_players if p not in new]
 
             for player in joined:
                 log.info(f"Player joined: {player}")
-                embed = discord.Embed(
-                    description=f"🟢  **{player}** joined the server",
-                    color=0x2ECC71,
-                )
-                await channel.send(embed=embed)
-
             for player in left:
                 log.info(f"Player left: {player}")
-                embed = discord.Embed(
-                    description=f"🔴  **{player}** left the server", color=0xE74C3C
-                )
-                await channel.send(embed=embed)
 
             if joined or left:
+                queue_player_changes(channel, joined, left)
                 current_players = names
-                await post_status(channel, Status.ONLINE, names)
+                queue_status(channel, Status.ONLINE, names)
 
         else:
             # RCON failed — fall back to log tail + mtime
@@ -354,56 +679,91 @@ async def monitor_loop():
                     log.info("'Stopping server' detected → OFFLINE")
                 else:
                     log.info(f"Log stale ({log_age:.0f}s) and RCON down → OFFLINE")
-                for player in current_players:
-                    embed = discord.Embed(
-                        description=f"🔴  **{player}** left the server",
-                        color=0xE74C3C,
-                    )
-                    await channel.send(embed=embed)
+                if current_players:
+                    queue_player_changes(channel, [], current_players)
                 current_status = Status.OFFLINE
                 current_players = []
                 last_mtime = mtime
-                await post_status(channel, Status.OFFLINE, [])
+                queue_status(channel, Status.OFFLINE, [])
             else:
                 log.info(
                     f"Log fresh ({log_age:.0f}s), no stop signal — keeping ONLINE despite RCON failure"
                 )
 
     last_mtime = mtime
+    return True
+
+
+async def delete_old_message(message: discord.Message, slots: asyncio.Semaphore):
+    async with slots:
+        try:
+            await message.delete()
+            log.info(f"Deleted old status message: {message.id}")
+        except discord.NotFound:
+            pass
+        except discord.HTTPException as e:
+            log.warning(f"Could not delete old status message {message.id}: {e}")
 
 
 @bot.event
 async def on_ready():
     log.info(f"Logged in as {bot.user} (id: {bot.user.id})")
 
-    # Try to find the channel and clean up old messages before starting the loop
-    channel = bot.get_channel(int(DISCORD_CHANNEL_ID))
-    if channel is not None:
-        log.info("Scanning channel for old status messages to clean up...")
-        async for message in channel.history(limit=50):
-            if (
-                message.author == bot.user
-                and message.embeds
-                and message.embeds[0].title
-                and any(
-                    message.embeds[0].title.startswith(p) for p in ("🔴", "🟡", "🟢")
-                )
-            ):
-                try:
-                    await message.delete()
-                    log.info(f"Deleted old status message: {message.id}")
-                except discord.NotFound:
-                    pass
 
-        await post_status(channel, current_status, current_players)
-    else:
+async def clean_up_channel(channel: discord.TextChannel):
+    """Adopt the newest old status message as ours and delete any older ones."""
+    global status_message
+    log.info("Scanning channel for old status messages to clean up...")
+    old_messages = []
+    non_match_streak = 0
+    cutoff = discord.utils.utcnow() - CLEANUP_MAX_AGE
+    async for message in channel.history(limit=50, oldest_first=False):
+        if (
+            message.author == bot.user
+            and message.embeds
+            and message.embeds[0].title
+            and message.embeds[0].title.startswith(_STATUS_PREFIXES)
+        ):
+            old_messages.append(message)
+            non_match_streak = 0
+        elif not old_messages or message.author == bot.user:
+            # Chat piles up below the edited-in-place status message, so only
+            # stop early once it was found, and never on our own notices
+            continue
+        elif message.created_at < cutoff:
+            break
+        else:
+            non_match_streak += 1
+            if non_match_streak >= CLEANUP_MAX_NON_MATCHES:
+                break
+    if old_messages and status_message is None:
+        status_message = old_messages.pop(0)  # newest, edited by post_status
+        log.info(f"Reusing previous status message: {status_message.id}")
+    delete_slots = asyncio.Semaphore(CLEANUP_CONCURRENCY)
+    await asyncio.gather(*(delete_old_message(m, delete_slots) for m in old_messages))
+
+
+@monitor_loop.before_loop
+async def before_monitor_loop():
+    await bot.wait_until_ready()
+
+    # Try to find the channel and clean up old messages before starting the loop
+    channel = bot.get_channel(DISCORD_CHANNEL_ID)
+    if channel is None:
         log.error(
             f"Could not find Discord channel {DISCORD_CHANNEL_ID} during startup."
         )
+        return
 
-    if not monitor_loop.is_running():
-        log.info("Starting monitor loop.")
-        monitor_loop.start()
+    # before_loop runs outside the task's retry handling: an error escaping here
+    # would stop the monitor loop for good, so log it and start polling anyway
+    try:
+        await clean_up_channel(channel)
+        await post_status(channel, current_status, current_players)
+    except (discord.HTTPException, aiohttp.ClientError, OSError) as e:
+        log.error(f"Startup channel cleanup failed, starting monitor anyway: {e}")
+        # post_status edits an adopted message or sends a new one, so always retry
+        queue_status(channel, current_status, current_players)
 
 
 bot.run(DISCORD_TOKEN)